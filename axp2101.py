@@ -29,14 +29,69 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/CDarius/CircuitPython_AXP2101.git"
 
+import struct
+import time
 from adafruit_bus_device.i2c_device import I2CDevice
 
 try:
     import busio
-    from typing import Tuple
+    from typing import Optional, Tuple
 except ImportError:
     pass
 
+try:
+    # Only required by the ``*_async`` methods
+    import asyncio
+except ImportError:
+    pass
+
+# LDO outputs parameters indexed by LDO number:
+# (voltage register, enable bit, enable register, voltage step mV, max voltage mV)
+_LDO_TABLE = (
+    (0x92, 0x01, 0x90, 100, 3500),  # ALDO1
+    (0x93, 0x02, 0x90, 100, 3500),  # ALDO2
+    (0x94, 0x04, 0x90, 100, 3500),  # ALDO3
+    (0x95, 0x08, 0x90, 100, 3500),  # ALDO4
+    (0x96, 0x10, 0x90, 100, 3500),  # BLDO1
+    (0x97, 0x20, 0x90, 100, 3500),  # BLDO2
+    (0x99, 0x80, 0x90, 100, 3400),  # DLDO1
+    (0x9A, 0x01, 0x91, 50, 1400),  # DLDO2
+)
+
+# LDO name -> LDO index in _LDO_TABLE
+_LDO_NAMES = {
+    "aldo1": 0,
+    "aldo2": 1,
+    "aldo3": 2,
+    "aldo4": 3,
+    "bldo1": 4,
+    "bldo2": 5,
+    "dldo1": 6,
+    "dldo2": 7,
+}
+
+
+def _ldo_reg_value(index: int, voltage: int) -> Optional[int]:
+    """Convert an LDO output voltage to its voltage register value
+
+    :param int index: LDO index in ``_LDO_TABLE``
+    :param int voltage: Output voltage in mV. 0 disable the output
+    :returns: The voltage register value or ``None`` when ``voltage`` is 0
+    """
+    if not 0 <= index < len(_LDO_TABLE):
+        raise ValueError("Invalid LDO number")
+
+    _, _, _, step_volt, max_volt = _LDO_TABLE[index]
+
+    if voltage == 0:
+        return None
+    if 500 <= voltage <= max_volt:
+        # A single small int floor division is already one interpreter op,
+        # multiply and shift tricks would add ops without saving time
+        return (voltage - 500) // step_volt
+
+    raise ValueError(f"LDO voltage out of range. Allowed values 0 or 500-{max_volt} mV")
+
 
 # pylint: disable=too-few-public-methods
 class BatteryStatus:
@@ -59,15 +114,82 @@ class BatteryStatus:
 
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BatteryStatus):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
 
 #: BatteryStatus: The battery is charging
 BatteryStatus.DISCHARGING = BatteryStatus(1)
 BatteryStatus.STANDBY = BatteryStatus(2)
 BatteryStatus.CHARGING = BatteryStatus(3)
 
+# Battery status indexed by the charging status bits of register 0x01
+_BATTERY_STATUS_LUT = (
+    BatteryStatus.STANDBY,
+    BatteryStatus.CHARGING,
+    BatteryStatus.DISCHARGING,
+    None,
+)
+
+
+class _BusBatch:
+    """Reentrant context manager holding an I2C device
+
+    Only the outermost ``with`` block locks the I2C device, the nested ones
+    reuse the lock. This allows to group many register accesses in a single
+    bus lock
+
+    :param ~adafruit_bus_device.i2c_device.I2CDevice device: The I2C device to lock
+    """
+
+    def __init__(self, device: I2CDevice):
+        self._device = device
+        self._depth = 0
+
+    def __enter__(self) -> "_BusBatch":
+        if self._depth == 0:
+            self._device.__enter__()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, traceback) -> bool:
+        self._depth -= 1
+        if self._depth == 0:
+            self._device.__exit__(exc_type, exc_val, traceback)
+        return False
+
+
+class _LDOProp:
+    """Get/set an LDO ouput voltage in mV
+
+    Setting the property to 0 disable the output
+
+    :param int index: LDO index in ``_LDO_TABLE``
+    """
+
+    def __init__(self, index: int):
+        self._index = index
+
+    def __get__(self, obj, objtype=None) -> int:
+        if obj is None:
+            return self
+        # pylint: disable=protected-access
+        return obj._get_ldo_by_index(self._index)
+
+    def __set__(self, obj, voltage: int) -> None:
+        # pylint: disable=protected-access
+        obj._set_ldo_by_index(self._index, voltage)
+
 
 class AXP2101:
     """Circuitpython driver for AXP2101 power management IC
@@ -104,17 +226,51 @@ class AXP2101:
 
         is_battery_connected = pmic.is_battery_connected
         battery_voltage = pmic.battery_voltage
+
+    Battery readings change slowly, when they are polled in a tight loop
+    they can be cached for a few milliseconds to reduce the I2C traffic
+
+    .. code-block:: python
+
+        pmic.battery_level_ttl_ms = 100
+        pmic.battery_voltage_ttl_ms = 100
     """
 
+    #: Maximum age in ms of a cached :py:attr:`battery_level` reading. 0 disable the cache
+    battery_level_ttl_ms = 0
+    #: Maximum age in ms of a cached :py:attr:`battery_voltage` reading. 0 disable the cache
+    battery_voltage_ttl_ms = 0
+    #: Maximum age in ms of a cached :py:attr:`is_battery_connected` reading.
+    #: 0 disable the cache
+    is_battery_connected_ttl_ms = 0
+    #: Minimum interval in ms between two :py:attr:`power_key_was_pressed` bus reads.
+    #: Reading the property more often returns no key press, the key events stay
+    #: latched in AXP2101 and are returned by the next bus read. 0 disable the limit
+    power_key_min_poll_interval_ms = 0
+
     def __init__(self, i2c: busio.I2C, device_address: int = 0x34):
         self._device = I2CDevice(i2c, device_address)
-        self._buffer = bytearray(2)
-        # Enable power key press interrupt
-        self._set_bit_in_register(0x41, 0x0C, True)
-        # Enable battery voltage ADC
-        self._set_bit_in_register(0x30, 0x01, True)
-        # Enable all ALDOxx
-        self._set_bit_in_register(0x90, 0x0F, True)
+        # Bound methods cached to save an attribute lookup on every bus access.
+        # write_then_readinto maps to busio.I2C.writeto_then_readfrom, so every
+        # register read is a single repeated-start transaction without a STOP
+        self._wtr = self._device.write_then_readinto
+        self._w = self._device.write
+        # Byte 0 holds the register address, the following bytes the register data.
+        # Sized for the longest burst read so no buffer is allocated at runtime
+        self._buffer = bytearray(16)
+        self._mv = memoryview(self._buffer)
+        # Register number -> (value, time.monotonic_ns() of the reading)
+        self._cache = {}
+        self._power_key_poll_ns = None
+        # Register accesses done inside "with self._batch:" share one bus lock
+        self._batch = _BusBatch(self._device)
+        with self._batch:
+            # Enable power key press interrupt
+            self._set_bit_in_register(0x41, 0x0C, True)
+            # Enable battery voltage ADC
+            self._set_bit_in_register(0x30, 0x01, True)
+            # Enable all ALDOxx
+            self._set_bit_in_register(0x90, 0x0F, True)
 
     def power_off(self) -> None:
         """Switch off the AXP2101 and the connected devices"""
@@ -126,19 +282,39 @@ class AXP2101:
 
         :returns: Two booleans: Power key is short press and power key is long press
         """
-        reg_val = self._read_register8(0x49)
-        short_press = (reg_val & 0x08) != 0
-        long_press = (reg_val & 0x04) != 0
-        # clear the readed interrupt events
-        if short_press or long_press:
-            self._write_register8(0x49, 0x0C)
+        if not self._power_key_poll_due():
+            return (False, False)
+
+        with self._batch:
+            events = self._read_register8(0x49) & 0x0C
+            # clear only the readed interrupt events, a new event latched meanwhile
+            # is reported by the next read
+            if events:
+                self._write_register8(0x49, events)
 
-        return (short_press, long_press)
+        return ((events & 0x08) != 0, (events & 0x04) != 0)
+
+    def _power_key_poll_due(self) -> bool:
+        """Check :py:attr:`power_key_min_poll_interval_ms` before a power key read
+
+        :returns: True when the power key status register has to be read
+        """
+        if self.power_key_min_poll_interval_ms > 0:
+            now = time.monotonic_ns()
+            if (
+                self._power_key_poll_ns is not None
+                and now - self._power_key_poll_ns
+                < self.power_key_min_poll_interval_ms * 1000000
+            ):
+                return False
+            self._power_key_poll_ns = now
+
+        return True
 
     @property
     def is_battery_connected(self) -> bool:
         """True when a battery is connected to AXP2101"""
-        reg_val = self._read_register8(0x00)
+        reg_val = self._read_register8(0x00, self.is_battery_connected_ttl_ms)
         return (reg_val & 0b00001000) != 0
 
     @property
@@ -147,12 +323,12 @@ class AXP2101:
 
         Returns 0 if no battery is connected to AXP2101
         """
-        return self._read_register8(0xA4)
+        return self._read_register8(0xA4, self.battery_level_ttl_ms)
 
     @property
     def battery_voltage(self) -> int:
         """Battery voltage in mV"""
-        return self._read_register14(0x34)
+        return self._read_register14(0x34, self.battery_voltage_ttl_ms)
 
     @property
     def battery_charging_enabled(self) -> bool:
@@ -162,10 +338,7 @@ class AXP2101:
 
     @battery_charging_enabled.setter
     def battery_charging_enabled(self, enabled: bool) -> None:
-        if isinstance(enabled, bool):
-            self._set_bit_in_register(0x18, 0x02, enabled)
-        else:
-            raise ValueError("Enabled must be a boolean")
+        self._set_bit_in_register(0x18, 0x02, bool(enabled))
 
     @property
     def battery_status(self) -> BatteryStatus:
@@ -185,223 +358,168 @@ class AXP2101:
         +-------------------------------------------+
 
         """
-        if not self.is_battery_connected:
-            return None
-
-        reg_val = (self._read_register8(0x01) & 0b01100000) >> 5
-        if reg_val == 0b00:
-            return BatteryStatus.STANDBY
-        if reg_val == 0b01:
-            return BatteryStatus.CHARGING
-        if reg_val == 0b10:
-            return BatteryStatus.DISCHARGING
+        # Read battery presence (0x00) and charging status (0x01) in a single burst
+        regs = self._read_registers(0x00, 2)
+        if self.is_battery_connected_ttl_ms > 0:
+            self._cache[0x00] = (regs[0], time.monotonic_ns())
 
-        return None
-
-    @property
-    def _aldo1_voltage_setpoint(self) -> int:
-        """Get/set ALDO1 ouput voltage in mV
-
-        The output achievable voltage range is 500-3500 mV
-        Setting property to 0 disable the output
-        """
-        return self.__get_ldo(0)
-
-    @_aldo1_voltage_setpoint.setter
-    def _aldo1_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_ldo(0, voltage)
-
-    @property
-    def _aldo2_voltage_setpoint(self) -> int:
-        """Get/set ALDO2 ouput voltage in mV
-
-        The output achievable voltage range is 500-3500 mV
-        Setting property to 0 disable the output
-        """
-        return self.__get_ldo(1)
-
-    @_aldo2_voltage_setpoint.setter
-    def _aldo2_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_ldo(1, voltage)
-
-    @property
-    def _aldo3_voltage_setpoint(self) -> int:
-        """Get/set ALDO3 ouput voltage in mV
+        if (regs[0] & 0b00001000) == 0:
+            return None
 
-        The output achievable voltage range is 500-3500 mV
-        Setting property to 0 disable the output
-        """
-        return self.__get_ldo(2)
+        return _BATTERY_STATUS_LUT[(regs[1] >> 5) & 0b11]
 
-    @_aldo3_voltage_setpoint.setter
-    def _aldo3_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_ldo(2, voltage)
+    async def power_key_was_pressed_async(self) -> Tuple[bool, bool]:
+        """Coroutine version of :py:attr:`power_key_was_pressed`
 
-    @property
-    def _aldo4_voltage_setpoint(self) -> int:
-        """Get/set ALDO4 ouput voltage in mV
+        Yields to the event loop after the bus access. Requires the ``asyncio`` module
 
-        The output achievable voltage range is 500-3500 mV
-        Setting property to 0 disable the output
+        :returns: Two booleans: Power key is short press and power key is long press
         """
-        return self.__get_ldo(3)
+        value = self.power_key_was_pressed
+        await asyncio.sleep(0)
+        return value
 
-    @_aldo4_voltage_setpoint.setter
-    def _aldo4_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_ldo(3, voltage)
-
-    @property
-    def _bldo1_voltage_setpoint(self) -> int:
-        """Get/set BLDO1 ouput voltage in mV
+    async def is_battery_connected_async(self) -> bool:
+        """Coroutine version of :py:attr:`is_battery_connected`
 
-        The output achievable voltage range is 500-3500 mV
-        Setting property to 0 disable the output
+        Yields to the event loop after the bus access. Requires the ``asyncio`` module
         """
-        return self.__get_ldo(4)
+        value = self.is_battery_connected
+        await asyncio.sleep(0)
+        return value
 
-    @_bldo1_voltage_setpoint.setter
-    def _bldo1_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_ldo(4, voltage)
+    async def battery_level_async(self) -> int:
+        """Coroutine version of :py:attr:`battery_level`
 
-    @property
-    def _bldo2_voltage_setpoint(self) -> int:
-        """Get/set BLDO2 ouput voltage in mV
-
-        The output achievable voltage range is 500-3500 mV
-        Setting property to 0 disable the output
+        Yields to the event loop after the bus access. Requires the ``asyncio`` module
         """
-        return self.__get_ldo(5)
+        value = self.battery_level
+        await asyncio.sleep(0)
+        return value
 
-    @_bldo2_voltage_setpoint.setter
-    def _bldo2_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_ldo(5, voltage)
-
-    @property
-    def _dldo1_voltage_setpoint(self) -> int:
-        """Get/set DLDO1 ouput voltage in mV
+    async def battery_voltage_async(self) -> int:
+        """Coroutine version of :py:attr:`battery_voltage`
 
-        The output achievable voltage range is 500-3400 mV
-        Setting property to 0 disable the output
+        Yields to the event loop after the bus access. Requires the ``asyncio`` module
         """
-        return self.__get_dldo(1)
+        value = self.battery_voltage
+        await asyncio.sleep(0)
+        return value
 
-    @_dldo1_voltage_setpoint.setter
-    def _dldo1_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_dldo(1, voltage)
+    async def battery_status_async(self) -> BatteryStatus:
+        """Coroutine version of :py:attr:`battery_status`
 
-    @property
-    def _dldo2_voltage_setpoint(self) -> int:
-        """Get/set DLDO2 ouput voltage in mV
-
-        The output achievable voltage range is 500-1400 mV
-        Setting property to 0 disable the output
+        Yields to the event loop after the bus access. Requires the ``asyncio`` module
         """
-        return self.__get_dldo(2)
-
-    @_dldo2_voltage_setpoint.setter
-    def _dldo2_voltage_setpoint(self, voltage: int) -> None:
-        self.__set_dldo(2, voltage)
-
-    def __set_ldo(self, num: int, voltage: int) -> None:
-        """Set an LDO (ALDOx, BLDOx) output voltage
-
-        :param int num: LDO number -> 0=ALDO1 ~ 3=ALDO4, 4=BLDO1, 5=BLDO2
+        value = self.battery_status
+        await asyncio.sleep(0)
+        return value
+
+    #: Get/set ALDO1 ouput voltage in mV. Range 500-3500 mV, 0 disable the output
+    _aldo1_voltage_setpoint = _LDOProp(0)
+    #: Get/set ALDO2 ouput voltage in mV. Range 500-3500 mV, 0 disable the output
+    _aldo2_voltage_setpoint = _LDOProp(1)
+    #: Get/set ALDO3 ouput voltage in mV. Range 500-3500 mV, 0 disable the output
+    _aldo3_voltage_setpoint = _LDOProp(2)
+    #: Get/set ALDO4 ouput voltage in mV. Range 500-3500 mV, 0 disable the output
+    _aldo4_voltage_setpoint = _LDOProp(3)
+    #: Get/set BLDO1 ouput voltage in mV. Range 500-3500 mV, 0 disable the output
+    _bldo1_voltage_setpoint = _LDOProp(4)
+    #: Get/set BLDO2 ouput voltage in mV. Range 500-3500 mV, 0 disable the output
+    _bldo2_voltage_setpoint = _LDOProp(5)
+    #: Get/set DLDO1 ouput voltage in mV. Range 500-3400 mV, 0 disable the output
+    _dldo1_voltage_setpoint = _LDOProp(6)
+    #: Get/set DLDO2 ouput voltage in mV. Range 500-1400 mV, 0 disable the output
+    _dldo2_voltage_setpoint = _LDOProp(7)
+
+    def _set_ldo_by_index(self, index: int, voltage: int) -> None:
+        """Set an LDO (ALDOx, BLDOx, DLDOx) output voltage
+
+        :param int index: LDO index in ``_LDO_TABLE`` -> 0=ALDO1 ~ 3=ALDO4,
+            4=BLDO1, 5=BLDO2, 6=DLDO1, 7=DLDO2
         :param int voltage: Desired output voltage in mV.
-            The output achievable voltage range is 500-3500 mV
+            The output achievable voltage range is 500-3500 mV for ALDOx and BLDOx,
+            500-3400 mV for DLDO1 and 500-1400 mV for DLDO2
             Setting ``voltage`` to 0 disable the output
         """
-        if 0 <= num <= 5:
-            reg_volt = num + 0x92
-            reg90bit = 1 << num
-            if 0 <= voltage <= 3500:
-                if voltage >= 500:
-                    reg_value = (voltage - 500) // 100
-                    self._write_register8(reg_volt, reg_value)
-                    self._set_bit_in_register(0x90, reg90bit, True)
-                else:
-                    self._set_bit_in_register(0x90, reg90bit, False)
-            else:
-                raise ValueError("LDO voltage out of range. Allowed range 0-3500 mV")
+        reg_value = _ldo_reg_value(index, voltage)
+        reg_volt, enable_bit, reg_enable, _, _ = _LDO_TABLE[index]
+        if reg_value is None:
+            self._set_bit_in_register(reg_enable, enable_bit, False)
         else:
-            raise ValueError("Invalid LDO number")
+            self._write_and_set_bit(reg_volt, reg_value, reg_enable, enable_bit)
 
-    def __get_ldo(self, num: int) -> int:
-        """Get an LDO (ALDOx, BLDOx) output voltage
+    def _set_rails(self, **rails: int) -> None:
+        """Set several LDO (ALDOx, BLDOx, DLDOx) output voltages at once
 
-        :param int num: LDO number -> 0=ALDO1 ~ 3=ALDO4, 4=BLDO1, 5=BLDO2
-        """
-        if 0 <= num <= 5:
-            reg_volt = num + 0x92
-            reg90bit = 1 << num
-            reg90 = self._read_register8(0x90)
-            if (reg90 & reg90bit) != 0:
-                reg_value = self._read_register8(reg_volt)
-                return reg_value * 100 + 500
-
-            return 0
+        The voltage registers are written first, then each enable register
+        (0x90, 0x91) is updated with at most one write. The I2C device is
+        acquired only once for the whole sequence
 
-        raise ValueError("Invalid LDO number")
+        .. code-block:: python
 
-    def __set_dldo(self, num: int, voltage: int) -> None:
-        """Set a DLDOx output voltage
+            self._set_rails(aldo1=3300, bldo2=1800, dldo1=0)
 
-        :param int num: DLDO number -> 1=DLDO1, 2=DLDO2
-        :param int voltage: Desired output voltage in mV.
-            The output achievable voltage range is 500-3400 mV for DLDO1
-            and 500-1400 mV for DLDO2
-            Setting ``voltage`` to 0 disable the output
+        :param int rails: Desired output voltage in mV by LDO name: ``aldo1`` ~ ``aldo4``,
+            ``bldo1``, ``bldo2``, ``dldo1``, ``dldo2``. Allowed values are the same of
+            the ``_xxxxx_voltage_setpoint`` properties, 0 disable the output
         """
-        if 1 <= num <= 2:
-            if num == 1:
-                reg_volt = 0x99
-                max_volt = 3400
-                reg_enable = 0x90
-                reg_enable_bit = 0x80
-            else:
-                reg_volt = 0x9A
-                max_volt = 1400
-                reg_enable = 0x91
-                reg_enable_bit = 0x01
-
-            if 0 <= voltage <= max_volt:
-                if voltage >= 500:
-                    step_volt = 100 if num == 1 else 50
-                    reg_value = (voltage - 500) // step_volt
-                    self._write_register8(reg_volt, reg_value)
-                    self._set_bit_in_register(reg_enable, reg_enable_bit, True)
-                else:
-                    self._set_bit_in_register(reg_enable, reg_enable_bit, False)
+        volt_writes = []
+        # Bits to set and to clear in 0x90 and 0x91 enable registers
+        set_bits = [0, 0]
+        clear_bits = [0, 0]
+        for name, voltage in rails.items():
+            try:
+                index = _LDO_NAMES[name]
+            except KeyError:
+                raise ValueError(f"Invalid LDO name {name}") from None
+
+            reg_value = _ldo_reg_value(index, voltage)
+            reg_volt, enable_bit, reg_enable, _, _ = _LDO_TABLE[index]
+            if reg_value is None:
+                clear_bits[reg_enable - 0x90] |= enable_bit
             else:
-                raise ValueError(
-                    f"LDO voltage out of range. Allowed range 0-{max_volt} mV"
-                )
-        else:
-            raise ValueError("Invald DLDO number")
-
-    def __get_dldo(self, num: int) -> None:
-        """Set a DLDOx output voltage
-
-        :param int num: DLDO number -> 1=DLDO1, 2=DLDO2
+                volt_writes.append((reg_volt, reg_value))
+                set_bits[reg_enable - 0x90] |= enable_bit
+
+        with self._batch:
+            for reg_volt, reg_value in volt_writes:
+                self._write_register8(reg_volt, reg_value)
+
+            # Read both enable registers in a single burst. The values are copied
+            # because the following writes reuse the buffer
+            enable_values = tuple(self._read_registers(0x90, 2))
+            for i, reg_value in enumerate(enable_values):
+                new_value = (reg_value & ~clear_bits[i]) | set_bits[i]
+                if new_value != reg_value:
+                    self._write_register8(0x90 + i, new_value)
+
+    def _get_ldo_by_index(self, index: int) -> int:
+        """Get an LDO (ALDOx, BLDOx, DLDOx) output voltage
+
+        :param int index: LDO index in ``_LDO_TABLE`` -> 0=ALDO1 ~ 3=ALDO4,
+            4=BLDO1, 5=BLDO2, 6=DLDO1, 7=DLDO2
         """
-        if 1 <= num <= 2:
-            if num == 1:
-                reg_volt = 0x99
-                reg_enable = 0x90
-                reg_enable_bit = 0x80
-            else:
-                reg_volt = 0x9A
-                reg_enable = 0x91
-                reg_enable_bit = 0x01
+        if not 0 <= index < len(_LDO_TABLE):
+            raise ValueError("Invalid LDO number")
 
-            reg_enable_val = self._read_register8(reg_enable)
-            if (reg_enable_val & reg_enable_bit) != 0:
-                step_volt = 100 if num == 1 else 50
-                reg_value = self._read_register8(reg_volt)
-                return reg_value * step_volt + 500
+        reg_volt, enable_bit, reg_enable, step_volt, _ = _LDO_TABLE[index]
 
-            return 0
+        offset = reg_volt - reg_enable
+        if offset <= 7:
+            # ALDOx, BLDOx: read from the enable register up to the voltage register
+            # in a single burst
+            regs = self._read_registers(reg_enable, offset + 1)
+            if (regs[0] & enable_bit) != 0:
+                return regs[offset] * step_volt + 500
+        else:
+            # DLDOx: the voltage register is far from the enable register, two single
+            # reads are shorter on the wire than a burst over the registers between
+            with self._batch:
+                if (self._read_register8(reg_enable) & enable_bit) != 0:
+                    return self._read_register8(reg_volt) * step_volt + 500
 
-        raise ValueError("Invald DLDO number")
+        return 0
 
     def _set_bit_in_register(self, register: int, bitmask: int, value: bool) -> None:
         """Set a single or multiple bits in a 8 bit register
@@ -411,17 +529,44 @@ class AXP2101:
         :param bool value: Desired bits value
         """
 
+        self._rmw8(register, bitmask, bitmask if value else 0)
+
+    def _rmw8(self, register: int, mask: int, value: int) -> None:
+        """Update the bits selected by ``mask`` in a 8 bit register
+
+        The register is read and then written back only if its value changes.
+        Both operations are done without releasing the I2C device
+
+        :param int register: Register number. Allowed range: 0-255
+        :param int mask: Bitmask 8 bit wide with the bits to update
+        :param int value: New value of the masked bits
+        """
+
+        self._cache.pop(register, None)
         self._buffer[0] = register
-        with self._device:
-            self._device.write_then_readinto(
-                self._buffer, self._buffer, out_end=1, in_start=1
-            )
-            if value:
-                self._buffer[1] |= bitmask
-            else:
-                self._buffer[1] &= ~bitmask
+        with self._batch:
+            self._wtr(self._buffer, self._buffer, out_end=1, in_start=1, in_end=2)
+            new_value = (self._buffer[1] & ~mask) | (value & mask)
+            if new_value != self._buffer[1]:
+                self._buffer[1] = new_value
+                self._w(self._buffer, end=2)
 
-            self._device.write(self._buffer)
+    def _write_and_set_bit(
+        self, register: int, value: int, bit_register: int, bitmask: int
+    ) -> None:
+        """Write an AXP2101 8bit register and then set bits in another register
+
+        Both operations are done in a single bus lock
+
+        :param int register: Register number to write. Allowed range: 0-255
+        :param int value: Value to write: Allowed range: 0x0 - 0xFF
+        :param int bit_register: Register number with the bits to set. Allowed range: 0-255
+        :param int bitmask: Bitmask 8 bit wide with the bits to set
+        """
+
+        with self._batch:
+            self._write_register8(register, value)
+            self._set_bit_in_register(bit_register, bitmask, True)
 
     def _write_register8(self, register: int, value: int) -> None:
         """Write an AXP2101 8bit register
@@ -430,35 +575,90 @@ class AXP2101:
         :param int value: Value to write: Allowed range: 0x0 - 0xFF
         """
 
+        self._cache.pop(register, None)
         self._buffer[0] = register
         self._buffer[1] = value
-        with self._device:
-            self._device.write(self._buffer)
+        with self._batch:
+            self._w(self._buffer, end=2)
+
+    def _get_cached(self, register: int, ttl_ms: int) -> Optional[int]:
+        """Get a cached register value
+
+        :param int register: Register number. Allowed range: 0-255
+        :param int ttl_ms: Maximum age of the cached value in ms
+        :returns: The cached register value or ``None`` if it is missing or too old
+        """
 
-    def _read_register8(self, register: int) -> int:
+        entry = self._cache.get(register)
+        if entry is not None and time.monotonic_ns() - entry[1] < ttl_ms * 1000000:
+            return entry[0]
+
+        return None
+
+    def _read_register8(self, register: int, ttl_ms: int = 0) -> int:
         """Read an AXP2101 8bit register
 
         :param int register: Register number. Allowed range: 0-255
+        :param int ttl_ms: When greater than 0 a cached value younger than
+            ``ttl_ms`` is returned without accessing the bus
         :returns: The register value
         """
 
+        if ttl_ms > 0:
+            value = self._get_cached(register, ttl_ms)
+            if value is not None:
+                return value
+
+        self._buffer[0] = register
+        with self._batch:
+            self._wtr(self._buffer, self._buffer, out_end=1, in_start=1, in_end=2)
+
+        value = self._buffer[1]
+        if ttl_ms > 0:
+            self._cache[register] = (value, time.monotonic_ns())
+
+        return value
+
+    def _read_registers(self, register: int, length: int) -> memoryview:
+        """Read consecutive AXP2101 8bit registers in a single bus transaction
+
+        AXP2101 auto-increments the register address, so all the registers
+        are read with one I2C transaction
+
+        :param int register: First register number. Allowed range: 0-255
+        :param int length: Number of registers to read. Allowed range: 1-15
+        :returns: The registers values. The returned view is overwritten by the
+            next register access
+        """
+
         self._buffer[0] = register
-        with self._device:
-            self._device.write_then_readinto(
-                self._buffer, self._buffer, out_end=1, in_end=1
+        with self._batch:
+            self._wtr(
+                self._buffer, self._buffer, out_end=1, in_start=1, in_end=1 + length
             )
 
-        return self._buffer[0]
+        return self._mv[1 : 1 + length]
 
-    def _read_register14(self, register: int) -> int:
+    def _read_register14(self, register: int, ttl_ms: int = 0) -> int:
         """Read an AXP2101 14bit register
 
         :param int register: Register number. Allowed range: 0-255
+        :param int ttl_ms: When greater than 0 a cached value younger than
+            ``ttl_ms`` is returned without accessing the bus
         :returns: The register value
         """
 
+        if ttl_ms > 0:
+            value = self._get_cached(register, ttl_ms)
+            if value is not None:
+                return value
+
         self._buffer[0] = register
-        with self._device:
-            self._device.write_then_readinto(self._buffer, self._buffer, out_end=1)
+        with self._batch:
+            self._wtr(self._buffer, self._buffer, out_end=1, in_start=1, in_end=3)
+
+        value = struct.unpack_from(">H", self._buffer, 1)[0] & 0x3FFF
+        if ttl_ms > 0:
+            self._cache[register] = (value, time.monotonic_ns())
 
-        return (self._buffer[0] & 0x3F) << 8 | self._buffer[1]
+        return value
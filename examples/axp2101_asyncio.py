@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 Dario Cammi
+#
+# SPDX-License-Identifier: Unlicense
+"""
+This script shows how to poll AXP2101 from asyncio tasks without
+blocking the other tasks
+"""
+import asyncio
+import board
+from axp2101 import AXP2101
+
+i2c = board.I2C()
+pmic = AXP2101(i2c)
+
+
+async def battery_monitor():
+    while True:
+        if await pmic.is_battery_connected_async():
+            battery_voltage = await pmic.battery_voltage_async()
+            print(f"Battery voltage {battery_voltage}mV")
+        else:
+            print("No battery connected")
+
+        await asyncio.sleep(1)
+
+
+async def power_key_monitor():
+    while True:
+        short_press, long_press = await pmic.power_key_was_pressed_async()
+        if short_press:
+            print("Power key was short pressed")
+        elif long_press:
+            print("Power key was long pressed")
+
+        await asyncio.sleep(0.1)
+
+
+async def main():
+    await asyncio.gather(
+        asyncio.create_task(battery_monitor()),
+        asyncio.create_task(power_key_monitor()),
+    )
+
+
+asyncio.run(main())